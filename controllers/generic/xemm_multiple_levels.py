@@ -1,6 +1,5 @@
-import time
 from decimal import Decimal
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 
 import pandas as pd
 from pydantic import Field, validator
@@ -80,12 +79,8 @@ class XEMMMultipleLevelsConfig(ControllerConfigBase):
         return v
 
     def update_markets(self, markets: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
-        if self.maker_connector not in markets:
-            markets[self.maker_connector] = set()
-        markets[self.maker_connector].add(self.maker_trading_pair)
-        if self.taker_connector not in markets:
-            markets[self.taker_connector] = set()
-        markets[self.taker_connector].add(self.taker_trading_pair)
+        markets.setdefault(self.maker_connector, set()).add(self.maker_trading_pair)
+        markets.setdefault(self.taker_connector, set()).add(self.taker_trading_pair)
         return markets
 
 
@@ -95,42 +90,43 @@ class XEMMMultipleLevels(ControllerBase):
         self.config = config
         self.buy_levels_targets_amount = config.buy_levels_targets_amount
         self.sell_levels_targets_amount = config.sell_levels_targets_amount
+        self.maker_market = ConnectorPair(connector_name=config.maker_connector, trading_pair=config.maker_trading_pair)
+        self.taker_market = ConnectorPair(connector_name=config.taker_connector, trading_pair=config.taker_trading_pair)
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
-        pass
+        mid_price = self.market_data_provider.get_price_by_type(self.config.maker_connector,
+                                                                self.config.maker_trading_pair, PriceType.MidPrice)
+        self.processed_data = {"mid_price": Decimal(mid_price)}
+
+    def _scan_executors(self) -> Tuple[Set[Decimal], Set[Decimal], int]:
+        """
+        Classify the executors in a single pass. Returns the target profitability of the active buy and sell
+        executors and the imbalance between the stopped buy and sell executors that got filled.
+        """
+        active_buy_targets = set()
+        active_sell_targets = set()
+        imbalance = 0
+        for e in self.executors_info:
+            is_buy = e.config.maker_side == TradeType.BUY
+            if not e.is_done:
+                (active_buy_targets if is_buy else active_sell_targets).add(e.config.target_profitability)
+            elif e.filled_amount_quote != 0:
+                imbalance += 1 if is_buy else -1
+        return active_buy_targets, active_sell_targets, imbalance
 
     def determine_executor_actions(self) -> List[ExecutorAction]:
         executor_actions = []
-        mid_price = self.market_data_provider.get_price_by_type(self.config.maker_connector, self.config.maker_trading_pair, PriceType.MidPrice)
-        active_buy_executors = self.filter_executors(
-            executors=self.executors_info,
-            filter_func=lambda e: not e.is_done and e.config.maker_side == TradeType.BUY
-        )
-        active_sell_executors = self.filter_executors(
-            executors=self.executors_info,
-            filter_func=lambda e: not e.is_done and e.config.maker_side == TradeType.SELL
-        )
-        stopped_buy_executors = self.filter_executors(
-            executors=self.executors_info,
-            filter_func=lambda e: e.is_done and e.config.maker_side == TradeType.BUY and e.filled_amount_quote != 0
-        )
-        stopped_sell_executors = self.filter_executors(
-            executors=self.executors_info,
-            filter_func=lambda e: e.is_done and e.config.maker_side == TradeType.SELL and e.filled_amount_quote != 0
-        )
-        imbalance = len(stopped_buy_executors) - len(stopped_sell_executors)
+        now = self.market_data_provider.time()
+        mid_price = self.processed_data["mid_price"]
+        active_buy_targets, active_sell_targets, imbalance = self._scan_executors()
         for target_profitability, amount in self.buy_levels_targets_amount:
-            active_buy_executors_target = [e.config.target_profitability == target_profitability for e in active_buy_executors]
-
-            if len(active_buy_executors_target) == 0 and imbalance < self.config.max_executors_imbalance:
+            if target_profitability not in active_buy_targets and imbalance < self.config.max_executors_imbalance:
                 config = XEMMExecutorConfig(
                     controller_id=self.config.id,
-                    timestamp=self.market_data_provider.time(),
-                    buying_market=ConnectorPair(connector_name=self.config.maker_connector,
-                                                trading_pair=self.config.maker_trading_pair),
-                    selling_market=ConnectorPair(connector_name=self.config.taker_connector,
-                                                 trading_pair=self.config.taker_trading_pair),
+                    timestamp=now,
+                    buying_market=self.maker_market,
+                    selling_market=self.taker_market,
                     maker_side=TradeType.BUY,
                     order_amount=amount / mid_price,
                     min_profitability=self.config.min_profitability,
@@ -139,15 +135,12 @@ class XEMMMultipleLevels(ControllerBase):
                 )
                 executor_actions.append(CreateExecutorAction(executor_config=config, controller_id=self.config.id))
         for target_profitability, amount in self.sell_levels_targets_amount:
-            active_sell_executors_target = [e.config.target_profitability == target_profitability for e in active_sell_executors]
-            if len(active_sell_executors_target) == 0 and imbalance > -self.config.max_executors_imbalance:
+            if target_profitability not in active_sell_targets and imbalance > -self.config.max_executors_imbalance:
                 config = XEMMExecutorConfig(
                     controller_id=self.config.id,
-                    timestamp=time.time(),
-                    buying_market=ConnectorPair(connector_name=self.config.taker_connector,
-                                                trading_pair=self.config.taker_trading_pair),
-                    selling_market=ConnectorPair(connector_name=self.config.maker_connector,
-                                                 trading_pair=self.config.maker_trading_pair),
+                    timestamp=now,
+                    buying_market=self.taker_market,
+                    selling_market=self.maker_market,
                     maker_side=TradeType.SELL,
                     order_amount=amount / mid_price,
                     min_profitability=self.config.min_profitability,
@@ -7,7 +7,6 @@ import threading
 import time
 from collections import deque
 from dataclasses import asdict, is_dataclass
-from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
@@ -455,7 +454,7 @@ class MQTTMarketEventForwarder:
         try:
             timestamp = event_data.pop('timestamp')
         except KeyError:
-            timestamp = datetime.now().timestamp()
+            timestamp = time.time()
 
         event_data = self._make_event_payload(event_data)
 
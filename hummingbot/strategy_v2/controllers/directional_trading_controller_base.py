@@ -140,9 +140,7 @@ class DirectionalTradingControllerConfigBase(ControllerConfigBase):
         return v
 
     def update_markets(self, markets: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
-        if self.connector_name not in markets:
-            markets[self.connector_name] = set()
-        markets[self.connector_name].add(self.trading_pair)
+        markets.setdefault(self.connector_name, set()).add(self.trading_pair)
         return markets
 
 
@@ -208,9 +208,7 @@ class MarketMakingControllerConfigBase(ControllerConfigBase):
         return spreads, [amt_pct * self.total_amount_quote for amt_pct in normalized_amounts_pct]
 
     def update_markets(self, markets: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
-        if self.connector_name not in markets:
-            markets[self.connector_name] = set()
-        markets[self.connector_name].add(self.trading_pair)
+        markets.setdefault(self.connector_name, set()).add(self.trading_pair)
         return markets
 
 
@@ -75,6 +75,9 @@ class XEMMExecutor(ExecutorBase):
             self.taker_connector = config.buying_market.connector_name
             self.taker_trading_pair = config.buying_market.trading_pair
             self.taker_order_side = TradeType.BUY
+        base, _ = split_hb_trading_pair(trading_pair=config.buying_market.trading_pair)
+        # TODO: also due the fact that we don't have a good rate oracle source we have to use a fixed token
+        self._tx_cost_asset = base[1:] if base.startswith("W") else base
         taker_connector = strategy.connectors[self.taker_connector]
         if not self.is_amm_connector(exchange=self.taker_connector):
             if OrderType.MARKET not in taker_connector.supported_order_types():
@@ -143,16 +146,13 @@ class XEMMExecutor(ExecutorBase):
             self._maker_target_price = self._taker_result_price * (1 - self.config.target_profitability - self._tx_cost_pct)
 
     async def get_tx_cost(self):
-        base, quote = split_hb_trading_pair(trading_pair=self.config.buying_market.trading_pair)
-        # TODO: also due the fact that we don't have a good rate oracle source we have to use a fixed token
-        base_without_wrapped = base[1:] if base.startswith("W") else base
         taker_fee = await self.get_tx_cost_in_asset(
             exchange=self.taker_connector,
             trading_pair=self.taker_trading_pair,
             order_type=OrderType.MARKET,
             is_buy=True,
             order_amount=self.config.order_amount,
-            asset=base_without_wrapped
+            asset=self._tx_cost_asset
         )
         maker_fee = await self.get_tx_cost_in_asset(
             exchange=self.maker_connector,
@@ -160,7 +160,7 @@ class XEMMExecutor(ExecutorBase):
             order_type=OrderType.LIMIT,
             is_buy=False,
             order_amount=self.config.order_amount,
-            asset=base_without_wrapped)
+            asset=self._tx_cost_asset)
         return taker_fee + maker_fee
 
     async def get_tx_cost_in_asset(self, exchange: str, trading_pair: str, is_buy: bool, order_amount: Decimal,
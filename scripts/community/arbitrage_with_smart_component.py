@@ -1,5 +1,7 @@
+from collections import deque
 from decimal import Decimal
 
+from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
@@ -13,12 +15,13 @@ class ArbitrageWithSmartComponent(ScriptStrategyBase):
     exchange_pair_2 = ConnectorPair(connector_name="uniswap_polygon_mainnet", trading_pair="WMATIC-USDT")
     order_amount = Decimal("50")  # in base asset
     min_profitability = Decimal("0.004")
+    closed_arbitrages_buffer = 100
 
     markets = {exchange_pair_1.connector_name: {exchange_pair_1.trading_pair},
                exchange_pair_2.connector_name: {exchange_pair_2.trading_pair}}
     active_buy_arbitrages = []
     active_sell_arbitrages = []
-    closed_arbitrage_executors = []
+    closed_arbitrage_executors = deque(maxlen=closed_arbitrages_buffer)
 
     def on_tick(self):
         self.cleanup_arbitrages()
@@ -45,26 +48,38 @@ class ArbitrageWithSmartComponent(ScriptStrategyBase):
 
     def create_arbitrage_executor(self, buying_exchange_pair: ConnectorPair, selling_exchange_pair: ConnectorPair):
         try:
+            base_asset, _ = split_hb_trading_pair(selling_exchange_pair.trading_pair)
+            _, quote_asset = split_hb_trading_pair(buying_exchange_pair.trading_pair)
             base_asset_for_selling_exchange = self.connectors[selling_exchange_pair.connector_name].get_available_balance(
-                selling_exchange_pair.trading_pair.split("-")[0])
+                base_asset)
             if self.order_amount > base_asset_for_selling_exchange:
-                self.logger().info(f"Insufficient balance in exchange {selling_exchange_pair.connector_name} "
-                                   f"to sell {selling_exchange_pair.trading_pair.split('-')[0]} "
-                                   f"Actual: {base_asset_for_selling_exchange} --> Needed: {self.order_amount}")
+                self.logger().info("Insufficient balance in exchange %s to sell %s Actual: %s --> Needed: %s",
+                                   selling_exchange_pair.connector_name, base_asset,
+                                   base_asset_for_selling_exchange, self.order_amount)
+                return
+
+            quote_asset_for_buying_exchange = self.connectors[buying_exchange_pair.connector_name].get_available_balance(
+                quote_asset)
+            if quote_asset_for_buying_exchange <= Decimal("0"):
+                self.logger().info("Insufficient balance in exchange %s to buy %s Actual: %s",
+                                   buying_exchange_pair.connector_name, quote_asset, quote_asset_for_buying_exchange)
                 return
 
             # Harcoded for now since we don't have a price oracle for WMATIC (CoinMarketCap rate source is requested and coming)
             pair_conversion = selling_exchange_pair.trading_pair.replace("W", "")
             price = RateOracle.get_instance().get_pair_rate(pair_conversion)
-            quote_asset_for_buying_exchange = self.connectors[buying_exchange_pair.connector_name].get_available_balance(
-                buying_exchange_pair.trading_pair.split("-")[1])
-            if self.order_amount * price > quote_asset_for_buying_exchange:
-                self.logger().info(f"Insufficient balance in exchange {buying_exchange_pair.connector_name} "
-                                   f"to buy {buying_exchange_pair.trading_pair.split('-')[1]} "
-                                   f"Actual: {quote_asset_for_buying_exchange} --> Needed: {self.order_amount * price}")
+            if not price:
+                self.logger().debug("Rate for %s is not available yet.", pair_conversion)
+                return
+            quote_amount_needed = self.order_amount * price
+            if quote_amount_needed > quote_asset_for_buying_exchange:
+                self.logger().info("Insufficient balance in exchange %s to buy %s Actual: %s --> Needed: %s",
+                                   buying_exchange_pair.connector_name, quote_asset,
+                                   quote_asset_for_buying_exchange, quote_amount_needed)
                 return
 
             arbitrage_config = ArbitrageExecutorConfig(
+                timestamp=self.current_timestamp,
                 buying_market=buying_exchange_pair,
                 selling_market=selling_exchange_pair,
                 order_amount=self.order_amount,
@@ -75,26 +90,31 @@ class ArbitrageWithSmartComponent(ScriptStrategyBase):
             arbitrage_executor.start()
             return arbitrage_executor
         except Exception:
-            self.logger().error(f"Error creating executor to buy on {buying_exchange_pair.connector_name} and sell on {selling_exchange_pair.connector_name}")
+            self.logger().error("Error creating executor to buy on %s and sell on %s",
+                                buying_exchange_pair.connector_name, selling_exchange_pair.connector_name, exc_info=True)
 
     def format_status(self) -> str:
-        status = []
-        status.extend([f"Closed Arbtriages: {len(self.closed_arbitrage_executors)}"])
+        return "\n".join(self.iter_status_lines())
+
+    def iter_status_lines(self):
+        yield f"Closed Arbtriages: {len(self.closed_arbitrage_executors)}"
         for arbitrage in self.closed_arbitrage_executors:
-            status.extend(arbitrage.to_format_status())
-        status.extend([f"Active Arbitrages: {len(self.active_sell_arbitrages) + len(self.active_buy_arbitrages)}"])
+            yield from arbitrage.to_format_status()
+        yield f"Active Arbitrages: {len(self.active_sell_arbitrages) + len(self.active_buy_arbitrages)}"
         for arbitrage in self.active_sell_arbitrages:
-            status.extend(arbitrage.to_format_status())
+            yield from arbitrage.to_format_status()
         for arbitrage in self.active_buy_arbitrages:
-            status.extend(arbitrage.to_format_status())
-        return "\n".join(status)
+            yield from arbitrage.to_format_status()
 
     def cleanup_arbitrages(self):
-        for arbitrage in self.active_buy_arbitrages:
-            if arbitrage.is_closed:
-                self.closed_arbitrage_executors.append(arbitrage)
-                self.active_buy_arbitrages.remove(arbitrage)
-        for arbitrage in self.active_sell_arbitrages:
+        self.active_buy_arbitrages = self.archive_closed_arbitrages(self.active_buy_arbitrages)
+        self.active_sell_arbitrages = self.archive_closed_arbitrages(self.active_sell_arbitrages)
+
+    def archive_closed_arbitrages(self, arbitrages):
+        still_active = []
+        for arbitrage in arbitrages:
             if arbitrage.is_closed:
                 self.closed_arbitrage_executors.append(arbitrage)
-                self.active_sell_arbitrages.remove(arbitrage)
+            else:
+                still_active.append(arbitrage)
+        return still_active
@@ -70,9 +70,7 @@ class TWAPMultiplePairs(StrategyV2Base):
         """
         markets = {}
         for twap_config in config.twap_configs:
-            if twap_config.connector_name not in markets:
-                markets[twap_config.connector_name] = set()
-            markets[twap_config.connector_name].add(twap_config.trading_pair)
+            markets.setdefault(twap_config.connector_name, set()).add(twap_config.trading_pair)
         cls.markets = markets
 
     def __init__(self, connectors: Dict[str, ConnectorBase], config: TWAPMultiplePairsConfig):
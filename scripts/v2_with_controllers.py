@@ -1,5 +1,4 @@
 import os
-import time
 from decimal import Decimal
 from typing import Dict, List, Optional, Set
 
@@ -53,14 +52,12 @@ class GenericV2StrategyWithCashOut(StrategyV2Base):
         self.performance_report_interval: int = self.config.performance_report_interval
         self.rebalance_interval: int = self.config.rebalance_interval
         self._last_performance_report_timestamp = 0
+        self._performance_reports_timestamp = None
         self._last_rebalance_check_timestamp = 0
         hb_app = HummingbotApplication.main_application()
         self.mqtt_enabled = hb_app._mqtt is not None
         self._pub: Optional[ETopicPublisher] = None
-        if self.config.time_to_cash_out:
-            self.cash_out_time = self.config.time_to_cash_out + time.time()
-        else:
-            self.cash_out_time = None
+        self.cash_out_time: Optional[float] = None
 
     def start(self, clock: Clock, timestamp: float) -> None:
         """
@@ -69,6 +66,8 @@ class GenericV2StrategyWithCashOut(StrategyV2Base):
         :param timestamp: Current time.
         """
         self._last_timestamp = timestamp
+        if self.config.time_to_cash_out:
+            self.cash_out_time = self.config.time_to_cash_out + timestamp
         self.apply_initial_setting()
         if self.mqtt_enabled:
             self._pub = ETopicPublisher("performance", use_bot_prefix=True)
@@ -81,12 +80,22 @@ class GenericV2StrategyWithCashOut(StrategyV2Base):
 
     def on_tick(self):
         super().on_tick()
-        self.performance_reports = {controller_id: self.executor_orchestrator.generate_performance_report(controller_id=controller_id).dict() for controller_id in self.controllers.keys()}
         self.control_rebalance()
-        self.control_cash_out()
-        self.control_max_drawdown()
+        stop_actions = self.control_cash_out()
+        stop_actions.extend(self.control_max_drawdown())
+        if stop_actions:
+            self.executor_orchestrator.execute_actions(stop_actions)
         self.send_performance_report()
 
+    def update_performance_reports(self):
+        """
+        Generate the performance reports of the controllers at most once per tick, only when the drawdown control or
+        the performance report publisher need them.
+        """
+        if self._performance_reports_timestamp != self.current_timestamp:
+            self.performance_reports = {controller_id: self.executor_orchestrator.generate_performance_report(controller_id=controller_id).dict() for controller_id in self.controllers.keys()}
+            self._performance_reports_timestamp = self.current_timestamp
+
     def control_rebalance(self):
         if self.rebalance_interval and self._last_rebalance_check_timestamp + self.rebalance_interval <= self.current_timestamp:
             balance_required = {}
@@ -146,13 +155,17 @@ class GenericV2StrategyWithCashOut(StrategyV2Base):
                             price=mid_price)
             self._last_rebalance_check_timestamp = self.current_timestamp
 
-    def control_max_drawdown(self):
+    def control_max_drawdown(self) -> List[StopExecutorAction]:
+        stop_actions = []
         if self.config.max_controller_drawdown:
-            self.check_max_controller_drawdown()
+            stop_actions.extend(self.check_max_controller_drawdown())
         if self.config.max_global_drawdown:
             self.check_max_global_drawdown()
+        return stop_actions
 
-    def check_max_controller_drawdown(self):
+    def check_max_controller_drawdown(self) -> List[StopExecutorAction]:
+        self.update_performance_reports()
+        stop_actions = []
         for controller_id, controller in self.controllers.items():
             controller_pnl = self.performance_reports[controller_id]["global_pnl_quote"]
             last_max_pnl = self.max_pnl_by_controller[controller_id]
@@ -167,12 +180,12 @@ class GenericV2StrategyWithCashOut(StrategyV2Base):
                         executors=self.executors_info[controller_id],
                         filter_func=lambda x: x.is_active and not x.is_trading,
                     )
-                    self.executor_orchestrator.execute_actions(
-                        actions=[StopExecutorAction(controller_id=controller_id, executor_id=executor.id) for executor in executors_order_placed]
-                    )
+                    stop_actions.extend([StopExecutorAction(controller_id=controller_id, executor_id=executor.id) for executor in executors_order_placed])
                     self.drawdown_exited_controllers.append(controller_id)
+        return stop_actions
 
     def check_max_global_drawdown(self):
+        self.update_performance_reports()
         current_global_pnl = sum([report["global_pnl_quote"] for report in self.performance_reports.values()])
         if current_global_pnl > self.max_global_pnl:
             self.max_global_pnl = current_global_pnl
@@ -185,15 +198,15 @@ class GenericV2StrategyWithCashOut(StrategyV2Base):
 
     def send_performance_report(self):
         if self.current_timestamp - self._last_performance_report_timestamp >= self.performance_report_interval and self.mqtt_enabled:
+            self.update_performance_reports()
             self._pub(self.performance_reports)
             self._last_performance_report_timestamp = self.current_timestamp
 
-    def control_cash_out(self):
+    def control_cash_out(self) -> List[StopExecutorAction]:
         self.evaluate_cash_out_time()
         if self.cashing_out:
-            self.check_executors_status()
-        else:
-            self.check_manual_cash_out()
+            return self.check_executors_status()
+        return self.check_manual_cash_out()
 
     def evaluate_cash_out_time(self):
         if self.cash_out_time and self.current_timestamp >= self.cash_out_time and not self.cashing_out:
@@ -204,37 +217,36 @@ class GenericV2StrategyWithCashOut(StrategyV2Base):
                     controller.stop()
             self.cashing_out = True
 
-    def check_manual_cash_out(self):
+    def check_manual_cash_out(self) -> List[StopExecutorAction]:
+        stop_actions = []
         for controller_id, controller in self.controllers.items():
             if controller.config.manual_kill_switch and controller.status == RunnableStatus.RUNNING:
                 self.logger().info(f"Manual cash out for controller {controller_id}.")
                 controller.stop()
                 executors_to_stop = self.get_executors_by_controller(controller_id)
-                self.executor_orchestrator.execute_actions(
-                    [StopExecutorAction(executor_id=executor.id,
-                                        controller_id=executor.controller_id) for executor in executors_to_stop])
+                stop_actions.extend([StopExecutorAction(executor_id=executor.id,
+                                                        controller_id=executor.controller_id) for executor in executors_to_stop])
             if not controller.config.manual_kill_switch and controller.status == RunnableStatus.TERMINATED:
                 if controller_id in self.drawdown_exited_controllers:
                     continue
                 self.logger().info(f"Restarting controller {controller_id}.")
                 controller.start()
+        return stop_actions
 
-    def check_executors_status(self):
-        active_executors = self.filter_executors(
-            executors=self.get_all_executors(),
-            filter_func=lambda executor: executor.status == RunnableStatus.RUNNING
-        )
-        if not active_executors:
+    def check_executors_status(self) -> List[StopExecutorAction]:
+        active_executors_count = 0
+        non_trading_executors = []
+        for executor in self.get_all_executors():
+            if executor.status == RunnableStatus.RUNNING:
+                active_executors_count += 1
+                if not executor.is_trading:
+                    non_trading_executors.append(executor)
+        if active_executors_count == 0:
             self.logger().info("All executors have finalized their execution. Stopping the strategy.")
             HummingbotApplication.main_application().stop()
-        else:
-            non_trading_executors = self.filter_executors(
-                executors=active_executors,
-                filter_func=lambda executor: not executor.is_trading
-            )
-            self.executor_orchestrator.execute_actions(
-                [StopExecutorAction(executor_id=executor.id,
-                                    controller_id=executor.controller_id) for executor in non_trading_executors])
+            return []
+        return [StopExecutorAction(executor_id=executor.id,
+                                   controller_id=executor.controller_id) for executor in non_trading_executors]
 
     def create_actions_proposal(self) -> List[CreateExecutorAction]:
         return []
@@ -244,15 +256,17 @@ class GenericV2StrategyWithCashOut(StrategyV2Base):
 
     def apply_initial_setting(self):
         connectors_position_mode = {}
+        leverage_by_market = {}
         for controller_id, controller in self.controllers.items():
             self.max_pnl_by_controller[controller_id] = Decimal("0")
             config_dict = controller.config.dict()
-            if "connector_name" in config_dict:
-                if self.is_perpetual(config_dict["connector_name"]):
-                    if "position_mode" in config_dict:
-                        connectors_position_mode[config_dict["connector_name"]] = config_dict["position_mode"]
-                    if "leverage" in config_dict:
-                        self.connectors[config_dict["connector_name"]].set_leverage(leverage=config_dict["leverage"],
-                                                                                    trading_pair=config_dict["trading_pair"])
+            connector_name = config_dict.get("connector_name")
+            if connector_name and self.is_perpetual(connector_name):
+                if "position_mode" in config_dict:
+                    connectors_position_mode[connector_name] = config_dict["position_mode"]
+                if "leverage" in config_dict:
+                    leverage_by_market[(connector_name, config_dict["trading_pair"])] = config_dict["leverage"]
+        for (connector_name, trading_pair), leverage in leverage_by_market.items():
+            self.connectors[connector_name].set_leverage(leverage=leverage, trading_pair=trading_pair)
         for connector_name, position_mode in connectors_position_mode.items():
             self.connectors[connector_name].set_position_mode(position_mode)